@@ -0,0 +1,21 @@
+from django.core.cache import cache
+
+TRENDING_CACHE_TIMEOUT = 30
+TRENDING_VERSION_KEY = 'trending:version'
+USER_ID_CACHE_TIMEOUT = 30
+
+
+def trending_cache_key(request):
+    version = cache.get_or_set(TRENDING_VERSION_KEY, 1, None)
+    return f'trending:v{version}:{request.build_absolute_uri()}'
+
+
+def invalidate_trending_cache():
+    try:
+        cache.incr(TRENDING_VERSION_KEY)
+    except ValueError:
+        cache.set(TRENDING_VERSION_KEY, 1, None)
+
+
+def user_id_cache_key(username):
+    return f'user:by-username:{username}'
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from api.models import Post, Like, Share, Comment
+
+
+def count_subquery(model, post_field):
+    counts = (
+        model.objects.filter(**{post_field: OuterRef('pk')})
+        .order_by()
+        .values(post_field)
+        .annotate(c=Count('pk'))
+        .values('c')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the denormalized like/share/comment counters of every post'
+
+    def handle(self, *args, **kwargs):
+        updated = Post.objects.update(
+            like_count=count_subquery(Like, 'post'),
+            share_count=count_subquery(Share, 'original_post'),
+            comment_count=count_subquery(Comment, 'post')
+        )
+
+        self.stdout.write(self.style.SUCCESS(f'Recounted {updated} posts.'))
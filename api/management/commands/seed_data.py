@@ -1,11 +1,16 @@
 import random
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.contrib.auth.models import User
+from django.contrib.auth.hashers import make_password
 from faker import Faker
 
 from api.models import Post, Like, Share, Comment
 
+BATCH_SIZE = 500
+COMMENT_POOL_SIZE = 20
+
 
 class Command(BaseCommand):
     help = 'Populates the database with sample data'
@@ -22,45 +27,58 @@ class Command(BaseCommand):
         fake = Faker()
 
         self.stdout.write("Creating users...")
-        users = []
-        for _ in range(5):
-            user = User.objects.create_user(
-                username=fake.user_name(),
-                email=fake.email(),
-                password='123'
-            )
-            users.append(user)
+        password = make_password('123')
+        users = User.objects.bulk_create(
+            [
+                User(username=fake.user_name(), email=fake.email(), password=password)
+                for _ in range(5)
+            ],
+            batch_size=BATCH_SIZE
+        )
 
         self.stdout.write("Creating posts...")
-        posts = []
-        for _ in range(25):
-            post = Post.objects.create(
-                author=random.choice(users),
-                title=fake.sentence(nb_words=6),
-                content=' '.join(fake.paragraphs(nb=3))
-            )
-            posts.append(post)
+        posts = Post.objects.bulk_create(
+            [
+                Post(
+                    author=random.choice(users),
+                    title=fake.sentence(nb_words=6),
+                    content=' '.join(fake.paragraphs(nb=3))
+                )
+                for _ in range(25)
+            ],
+            batch_size=BATCH_SIZE
+        )
 
         self.stdout.write("Creating interactions...")
+        comment_pool = [fake.paragraph(nb_sentences=2) for _ in range(COMMENT_POOL_SIZE)]
+        like_pairs, share_pairs, comments = set(), set(), []
         for post in posts:
             interacting_users = random.sample(users, random.randint(0, len(users)))
 
             for user in interacting_users:
                 if random.random() < 0.5:
-                    Like.objects.get_or_create(user=user, post=post)
+                    like_pairs.add((user.id, post.id))
                 if random.random() < 0.2 and user != post.author:
-                    Share.objects.get_or_create(user=user, original_post=post)
+                    share_pairs.add((user.id, post.id))
                 if random.random() < 0.3:
-                    Comment.objects.create(
+                    comments.append(Comment(
                         post=post,
                         author=user,
-                        content=fake.paragraph(nb_sentences=2)
-                    )
+                        content=random.choice(comment_pool)
+                    ))
+        Like.objects.bulk_create(
+            [Like(user_id=user_id, post_id=post_id) for user_id, post_id in like_pairs],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True
+        )
+        Share.objects.bulk_create(
+            [Share(user_id=user_id, original_post_id=post_id) for user_id, post_id in share_pairs],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True
+        )
+        Comment.objects.bulk_create(comments, batch_size=BATCH_SIZE)
+
         self.stdout.write("Updating counters...")
-        for post in Post.objects.all():
-            post.like_count = post.likes.count()
-            post.share_count = post.shared_by.count()
-            post.comment_count = post.comments.count()
-            post.save()
+        call_command('recount_posts', stdout=self.stdout)
 
-        self.stdout.write(self.style.SUCCESS('Successfully populated the database!'))
\ No newline at end of file
+        self.stdout.write(self.style.SUCCESS('Successfully populated the database!'))
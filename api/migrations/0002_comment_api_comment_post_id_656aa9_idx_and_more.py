@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'created_datetime'], name='api_comment_post_id_656aa9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-created_datetime'], name='api_post_created_5c44c6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='share',
+            index=models.Index(fields=['original_post', '-created_datetime'], name='api_share_origina_ceb665_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_comment_api_comment_post_id_656aa9_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-like_count', '-created_datetime'], name='post_trending_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_post_post_trending_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='share',
+            index=models.Index(fields=['user', '-created_datetime'], name='api_share_user_id_58d0e2_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.db import migrations
+
+# SearchFilter on PostViewSet filters post titles and author usernames with
+# icontains, which Django compiles on PostgreSQL to
+# UPPER(col::text) LIKE UPPER('%term%'). pg_trgm GIN indexes on that same
+# expression let those predicates use an index; other backends have no
+# equivalent, so they are left untouched.
+CREATE_SQL = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE INDEX IF NOT EXISTS api_post_title_trgm ON api_post USING GIN ((UPPER(title::text)) gin_trgm_ops)',
+    'CREATE INDEX IF NOT EXISTS auth_user_username_trgm ON auth_user USING GIN ((UPPER(username::text)) gin_trgm_ops)',
+]
+DROP_SQL = [
+    'DROP INDEX IF EXISTS auth_user_username_trgm',
+    'DROP INDEX IF EXISTS api_post_title_trgm',
+]
+
+
+def run_on_postgresql(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_post_api_post_author__ced446_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(run_on_postgresql(CREATE_SQL), run_on_postgresql(DROP_SQL)),
+    ]
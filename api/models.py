@@ -19,6 +19,11 @@ class Post(models.Model):
 
     class Meta:
         ordering = ['-created_datetime']
+        indexes = [
+            models.Index(fields=['-created_datetime']),
+            models.Index(fields=['-like_count', '-created_datetime'], name='post_trending_idx'),
+            models.Index(fields=['author', '-created_datetime']),
+        ]
 
 
 class Share(models.Model):
@@ -37,6 +42,10 @@ class Share(models.Model):
     class Meta:
         unique_together = ('user', 'original_post')
         ordering = ['-created_datetime']
+        indexes = [
+            models.Index(fields=['original_post', '-created_datetime']),
+            models.Index(fields=['user', '-created_datetime']),
+        ]
 
     def __str__(self):
         return f'{self.user.username} shared "{self.original_post.title}"'
@@ -62,6 +71,9 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ['created_datetime'] # Comentários mais antigos primeiro
+        indexes = [
+            models.Index(fields=['post', 'created_datetime']),
+        ]
 
     def __str__(self):
         return f'Comment by {self.author.username} on {self.post.title}'
\ No newline at end of file
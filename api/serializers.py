@@ -7,43 +7,49 @@ class CommentSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Comment
-        fields = ['id', 'author_username', 'content', 'created_datetime']
-        read_only_fields = ['id', 'author_username', 'created_datetime']
+        fields = ('id', 'author_username', 'content', 'created_datetime')
+        read_only_fields = ('id', 'author_username', 'created_datetime')
 
-class PostSerializer(serializers.ModelSerializer):
+class PostListSerializer(serializers.ModelSerializer):
+    # Querysets rendered by this serializer should select_related('author').
     author_username = serializers.ReadOnlyField(source='author.username')
-    comments = CommentSerializer(many=True, read_only=True)
 
     class Meta:
         model = Post
-        fields = [
+        fields = (
             'id', 'author_username', 'created_datetime', 'title', 'content', 
-            'share_count', 'like_count', 'comment_count', 'comments'
-        ]
-        read_only_fields = [
+            'share_count', 'like_count', 'comment_count'
+        )
+        read_only_fields = (
             'id', 'author_username', 'created_datetime', 
             'share_count', 'like_count', 'comment_count'
-        ]
+        )
+
+class PostSerializer(PostListSerializer):
+    comments = CommentSerializer(many=True, read_only=True)
+
+    class Meta(PostListSerializer.Meta):
+        fields = PostListSerializer.Meta.fields + ('comments',)
 
 class ShareSerializer(serializers.ModelSerializer):
     user_username = serializers.ReadOnlyField(source='user.username')
-    original_post = PostSerializer(read_only=True)
+    original_post = PostListSerializer(read_only=True)
 
     class Meta:
         model = Share
-        fields = ['id', 'user_username', 'created_datetime', 'original_post']
+        fields = ('id', 'user_username', 'created_datetime', 'original_post')
 
 class LikeSerializer(serializers.ModelSerializer):
     user_username = serializers.ReadOnlyField(source='user.username')
 
     class Meta:
         model = Like
-        fields = ['id', 'user_username', 'created_datetime']
+        fields = ('id', 'user_username', 'created_datetime')
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ['id', 'username', 'password']
+        fields = ('id', 'username', 'password')
         extra_kwargs = {'password': {'write_only': True}}
 
     def create(self, validated_data):
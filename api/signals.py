@@ -0,0 +1,20 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import post_delete, pre_save
+from django.dispatch import receiver
+
+from .cache import user_id_cache_key
+
+
+@receiver(pre_save, sender=User)
+def forget_renamed_username(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is None or (update_fields is not None and 'username' not in update_fields):
+        return
+    old_username = User.objects.filter(pk=instance.pk).values_list('username', flat=True).first()
+    if old_username is not None and old_username != instance.username:
+        cache.delete(user_id_cache_key(old_username))
+
+
+@receiver(post_delete, sender=User)
+def forget_deleted_username(sender, instance, **kwargs):
+    cache.delete(user_id_cache_key(instance.username))
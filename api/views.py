@@ -1,4 +1,6 @@
-from django.db import transaction
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F, Prefetch
 from django.contrib.auth.models import User
 from rest_framework import viewsets, permissions, generics, status
 from rest_framework.views import APIView
@@ -8,60 +10,108 @@ from rest_framework.decorators import action
 from rest_framework.filters import SearchFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import Post, Share, Like, Comment
-from .serializers import (PostSerializer,UserSerializer,ShareSerializer,LikeSerializer,CommentSerializer)
+from .serializers import (PostSerializer,PostListSerializer,UserSerializer,ShareSerializer,LikeSerializer,CommentSerializer)
 from .permissions import IsAuthorOrReadOnly
+from .cache import (TRENDING_CACHE_TIMEOUT, USER_ID_CACHE_TIMEOUT, trending_cache_key,
+                    invalidate_trending_cache, user_id_cache_key)
+
+
+POST_FIELDS = (
+    'id', 'author__username', 'created_datetime', 'title', 'content',
+    'share_count', 'like_count', 'comment_count',
+)
+COUNTER_FIELDS = ('share_count', 'like_count', 'comment_count')
+
+
+def comments_prefetch():
+    comments = Comment.objects.select_related('author').only(
+        'id', 'post', 'author__username', 'content', 'created_datetime'
+    )
+    return Prefetch('comments', queryset=comments)
 
 
 class PostViewSet(viewsets.ModelViewSet):
-    queryset = Post.objects.all().prefetch_related('comments', 'comments__author')
+    queryset = Post.objects.select_related('author').only(*POST_FIELDS)
     serializer_class = PostSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
     filter_backends = [DjangoFilterBackend, SearchFilter]
     search_fields = ['author__username', 'title']
     filterset_fields = ['created_datetime']
+    list_actions = ('list', 'trending')
+    update_actions = ('update', 'partial_update')
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in self.update_actions:
+            # Deferred fields are skipped by save(), so an edit cannot write back
+            # stale counters over likes, shares or comments made meanwhile.
+            return queryset.defer(*COUNTER_FIELDS)
+        if self.action == 'retrieve':
+            return queryset.prefetch_related(comments_prefetch())
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action in self.list_actions:
+            return PostListSerializer
+        return super().get_serializer_class()
 
     def perform_create(self, serializer):
         serializer.save(author=self.request.user)
+        invalidate_trending_cache()
+
+    def perform_update(self, serializer):
+        serializer.save()
+        serializer.instance.refresh_from_db(fields=COUNTER_FIELDS)
+        invalidate_trending_cache()
+
+    def perform_destroy(self, instance):
+        instance.delete()
+        invalidate_trending_cache()
 
     @action(detail=False, methods=['get'])
     def trending(self, request):
+        cache_key = trending_cache_key(request)
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+
         trending_posts = self.get_queryset().order_by('-like_count', '-created_datetime')
         page = self.paginate_queryset(trending_posts)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(trending_posts, many=True)
-        return Response(serializer.data)
+        serializer = self.get_serializer(page, many=True)
+        response = self.get_paginated_response(serializer.data)
+        cache.set(cache_key, response.data, TRENDING_CACHE_TIMEOUT)
+        return response
 
 
 class UserViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = User.objects.all()
+    queryset = User.objects.order_by('id')
     serializer_class = UserSerializer
     lookup_field = 'username'
 
+    def get_user_id(self):
+        key = user_id_cache_key(self.kwargs[self.lookup_field])
+        user_id = cache.get(key)
+        if user_id is None:
+            user_id = self.get_object().pk
+            cache.set(key, user_id, USER_ID_CACHE_TIMEOUT)
+        return user_id
+
     @action(detail=True, methods=['get'])
     def posts(self, request, username=None):
-        user = self.get_object()
-        user_posts = user.posts.all()
+        user_posts = Post.objects.filter(author_id=self.get_user_id()).select_related('author').only(*POST_FIELDS)
         page = self.paginate_queryset(user_posts)
-        if page is not None:
-            serializer = PostSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = PostSerializer(user_posts, many=True)
-        return Response(serializer.data)
+        serializer = PostListSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @action(detail=True, methods=['get'])
     def shares(self, request, username=None):
-        user = self.get_object()
-        user_shares = user.shares.all()
+        user_shares = Share.objects.filter(user_id=self.get_user_id()).select_related('user', 'original_post__author').only(
+            'id', 'created_datetime', 'user__username',
+            *(f'original_post__{field}' for field in POST_FIELDS)
+        )
         page = self.paginate_queryset(user_shares)
-        if page is not None:
-            serializer = ShareSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = ShareSerializer(user_shares, many=True)
-        return Response(serializer.data)
+        serializer = ShareSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 
 class UserCreateAPIView(generics.CreateAPIView):
@@ -74,86 +124,72 @@ class RepostAPIView(APIView):
     permission_classes = [IsAuthenticated]
     def post(self, request, pk):
         try:
-            post_to_share = Post.objects.get(pk=pk)
-        except Post.DoesNotExist:
-            return Response(status=status.HTTP_404_NOT_FOUND)
-        if post_to_share.author == request.user:
-            return Response({"error": "You cannot share your own post."}, status=status.HTTP_400_BAD_REQUEST)
-        with transaction.atomic():
-            share, created = Share.objects.get_or_create(
-                user=request.user,
-                original_post=post_to_share
-            )
-            if not created:
-                return Response({"error": "You have already shared this post."}, status=status.HTTP_400_BAD_REQUEST)
-            post_to_share.share_count += 1
-            post_to_share.save(update_fields=['share_count'])
+            with transaction.atomic():
+                shared = Post.objects.filter(pk=pk).exclude(author=request.user).update(
+                    share_count=F('share_count') + 1
+                )
+                if not shared:
+                    if Post.objects.filter(pk=pk).exists():
+                        return Response({"error": "You cannot share your own post."}, status=status.HTTP_400_BAD_REQUEST)
+                    return Response(status=status.HTTP_404_NOT_FOUND)
+                share = Share.objects.create(user=request.user, original_post_id=pk)
+                share.original_post = Post.objects.select_related('author').only(*POST_FIELDS).get(pk=pk)
+        except IntegrityError:
+            return Response({"error": "You have already shared this post."}, status=status.HTTP_400_BAD_REQUEST)
+        invalidate_trending_cache()
         return Response(ShareSerializer(share).data, status=status.HTTP_201_CREATED)
 
     def delete(self, request, pk):
-        try:
-            post_to_unshare = Post.objects.get(pk=pk)
-            with transaction.atomic():
-                share = Share.objects.get(user=request.user, original_post=post_to_unshare)
-                share.delete()
-                if post_to_unshare.share_count > 0:
-                    post_to_unshare.share_count -= 1
-                    post_to_unshare.save(update_fields=['share_count'])
-                return Response(status=status.HTTP_204_NO_CONTENT)
-        except (Post.DoesNotExist, Share.DoesNotExist):
-            return Response(status=status.HTTP_404_NOT_FOUND)
+        with transaction.atomic():
+            deleted, _ = Share.objects.filter(user=request.user, original_post_id=pk).delete()
+            if not deleted:
+                return Response(status=status.HTTP_404_NOT_FOUND)
+            Post.objects.filter(pk=pk, share_count__gt=0).update(share_count=F('share_count') - 1)
+        invalidate_trending_cache()
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class LikePostAPIView(APIView):
     permission_classes = [IsAuthenticated]
     def post(self, request, pk):
         try:
-            post_to_like = Post.objects.get(pk=pk)
-        except Post.DoesNotExist:
-            return Response(status=status.HTTP_404_NOT_FOUND)
-
-        with transaction.atomic():
-            like, created = Like.objects.get_or_create(
-                user=request.user,
-                post=post_to_like
-            )
-            if not created:
-                return Response({"error": "You have already liked this post."}, status=status.HTTP_400_BAD_REQUEST)
-            post_to_like.like_count += 1
-            post_to_like.save(update_fields=['like_count'])
+            with transaction.atomic():
+                if not Post.objects.filter(pk=pk).update(like_count=F('like_count') + 1):
+                    return Response(status=status.HTTP_404_NOT_FOUND)
+                like = Like.objects.create(user=request.user, post_id=pk)
+        except IntegrityError:
+            return Response({"error": "You have already liked this post."}, status=status.HTTP_400_BAD_REQUEST)
+        invalidate_trending_cache()
 
         return Response(LikeSerializer(like).data, status=status.HTTP_201_CREATED)
 
     def delete(self, request, pk):
-        try:
-            post_to_unlike = Post.objects.get(pk=pk)
-            with transaction.atomic():
-                like = Like.objects.get(user=request.user, post=post_to_unlike)
-                like.delete()
-                if post_to_unlike.like_count > 0:
-                    post_to_unlike.like_count -= 1
-                    post_to_unlike.save(update_fields=['like_count'])
-                return Response(status=status.HTTP_204_NO_CONTENT)
-        except (Post.DoesNotExist, Like.DoesNotExist):
-            return Response(status=status.HTTP_404_NOT_FOUND)
+        with transaction.atomic():
+            deleted, _ = Like.objects.filter(user=request.user, post_id=pk).delete()
+            if not deleted:
+                return Response(status=status.HTTP_404_NOT_FOUND)
+            Post.objects.filter(pk=pk, like_count__gt=0).update(like_count=F('like_count') - 1)
+        invalidate_trending_cache()
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class CommentViewSet(viewsets.ModelViewSet):
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
     def get_queryset(self):
-        return Comment.objects.filter(post_id=self.kwargs['post_pk'])
+        return Comment.objects.filter(post_id=self.kwargs['post_pk']).select_related('author')
     def perform_create(self, serializer):
-        post = Post.objects.get(pk=self.kwargs['post_pk'])
+        post_pk = self.kwargs['post_pk']
         with transaction.atomic():
-            serializer.save(author=self.request.user, post=post)
-            post.comment_count += 1
-            post.save(update_fields=['comment_count'])
+            if not Post.objects.filter(pk=post_pk).update(comment_count=F('comment_count') + 1):
+                raise Post.DoesNotExist('Post matching query does not exist.')
+            serializer.save(author=self.request.user, post_id=post_pk)
+        invalidate_trending_cache()
 
     def perform_destroy(self, instance):
-        post = instance.post
         with transaction.atomic():
             instance.delete()
-            if post.comment_count > 0:
-                post.comment_count -= 1
-                post.save(update_fields=['comment_count'])
\ No newline at end of file
+            Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+                comment_count=F('comment_count') - 1
+            )
+        invalidate_trending_cache()
\ No newline at end of file